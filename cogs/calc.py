@@ -6,6 +6,7 @@ import math
 import discord
 from discord import app_commands
 from discord.ext import commands
+from cogs.common import send_response, trash_button
 
 
 class CalcCog(commands.Cog):
@@ -144,39 +145,52 @@ class CalcCog(commands.Cog):
             "AutoPenalty": auto_penalty,
         }
 
+    def parse_stats(self, stats: str):
+        """
+        Parse a competitive stat line into the arguments of calculate_metrics.
+
+        Args:
+            stats (str): The statistics as a space-separated string.
+
+        Returns:
+            tuple: The stats dictionary, the SDI and the device.
+        """
+        data = stats.split()
+        if len(data) != 16:
+            raise ValueError("Invalid number of parameters, expected 16 values!")
+
+        return (
+            {
+                "xpb_minus_xpa": int(data[0]),
+                "rounds_played": int(data[1]),
+                "targets_assassinated": int(data[2]),
+                "escapes": int(data[3]),
+                "targets_protected": int(data[4]),
+                "damage_dealt": int(data[5]),
+                "final_shots": int(data[6]),
+                "target_survival": int(data[7]),
+                "free_for_all_kills": int(data[8]),
+                "free_for_all_wins": int(data[9]),
+                "infected_killed": int(data[10]),
+                "infection_survival": int(data[11]),
+                "infections": int(data[12]),
+                "epidemic": int(data[13]),
+            },
+            float(data[14]),
+            data[15].lower(),
+        )
+
     async def handle_calc(self, stats: str, interaction=None, context=None):
         """
         Shared logic for !calc (text command) and /calc (slash command).
         """
         try:
-            data = stats.split()
-            if len(data) != 16:
-                raise ValueError("Invalid number of parameters, expected 16 values!")
-
-            metrics = self.calculate_metrics(
-                {
-                    "xpb_minus_xpa": int(data[0]),
-                    "rounds_played": int(data[1]),
-                    "targets_assassinated": int(data[2]),
-                    "escapes": int(data[3]),
-                    "targets_protected": int(data[4]),
-                    "damage_dealt": int(data[5]),
-                    "final_shots": int(data[6]),
-                    "target_survival": int(data[7]),
-                    "free_for_all_kills": int(data[8]),
-                    "free_for_all_wins": int(data[9]),
-                    "infected_killed": int(data[10]),
-                    "infection_survival": int(data[11]),
-                    "infections": int(data[12]),
-                    "epidemic": int(data[13]),
-                },
-                sdi=float(data[14]),
-                device=data[15].lower(),
-            )
+            stats_dict, sdi, device = self.parse_stats(stats)
+            metrics = self.calculate_metrics(stats_dict, sdi=sdi, device=device)
 
             auto_penalty = metrics.get("AutoPenalty")
             title = (
-                f"auto-penalty: +{int(auto_penalty - int(data[1]))} rounds"
+                f"auto-penalty: +{int(auto_penalty - stats_dict['rounds_played'])} rounds"
                 if auto_penalty
                 else ""
             )
@@ -206,9 +220,6 @@ class CalcCog(commands.Cog):
             user_input_button = discord.ui.Button(
                 label="", style=discord.ButtonStyle.success, emoji="📄"
             )
-            trash_button = discord.ui.Button(
-                label="", style=discord.ButtonStyle.danger, emoji="🗑️"
-            )
 
             async def show_input_callback(interaction):
                 input_stats = (
@@ -218,26 +229,14 @@ class CalcCog(commands.Cog):
                 )
                 await interaction.response.send_message(input_stats, ephemeral=True)
 
-            async def clear_message_callback(interaction):
-                await interaction.response.defer()
-                await interaction.message.delete()
-
             user_input_button.callback = show_input_callback
-            trash_button.callback = clear_message_callback
             view.add_item(user_input_button)
-            view.add_item(trash_button)
+            view.add_item(trash_button())
 
-            if interaction:
-                await interaction.response.send_message(embed=embed, view=view)
-            elif context:
-                await context.send(embed=embed, view=view)
+            await send_response(interaction, context, embed=embed, view=view)
 
         except Exception as e:
-            error_message = f"Error: {str(e)}"
-            if interaction:
-                await interaction.response.send_message(error_message)
-            elif context:
-                await context.send(error_message)
+            await send_response(interaction, context, f"Error: {str(e)}")
 
     @app_commands.command(
         name="calc", description="Calculate Competitive OP from a copypasta"
@@ -6,6 +6,7 @@ import math
 import discord
 from discord import app_commands
 from discord.ext import commands
+from cogs.common import send_response
 
 
 class CasualCalcCog(commands.Cog):
@@ -141,6 +142,39 @@ class CasualCalcCog(commands.Cog):
             return "Wood (D)"
         return "Ember (E)"
 
+    def parse_stats(self, stats: str):
+        """
+        Parse a casual stat line into the stats dictionary of calculate_metrics.
+
+        Args:
+            stats (str): The statistics as a space-separated string.
+
+        Returns:
+            dict: A dictionary containing the game statistics.
+        """
+        data = stats.split()
+
+        return {
+            "lva": int(data[0]),
+            "xpa": int(data[1]),
+            "lvb": int(data[2]),
+            "xpb": int(data[3]),
+            "rounds_played": int(data[4]),
+            "targets_assassinated": int(data[5]),
+            "escapes": int(data[6]),
+            "guards_killed": int(data[7]),
+            "targets_protected": int(data[8]),
+            "damage_dealt": int(data[9]),
+            "final_shots": int(data[10]),
+            "target_survivals": int(data[11]),
+            "ffa_kills": int(data[12]),
+            "ffa_wins": int(data[13]),
+            "infected_killed": int(data[14]),
+            "infection_survival": int(data[15]),
+            "infections": int(data[16]),
+            "epidemics": int(data[17]),
+        }
+
     async def handle_calc(self, stats: str, interaction=None, context=None):
         """
         Shared logic for !casual (text command) and /casual (slash command).
@@ -151,33 +185,11 @@ class CasualCalcCog(commands.Cog):
             context (discord.Context): The context object (optional).
         """
         try:
-            data = stats.split()
-
-            metrics = self.calculate_metrics(
-                {
-                    "lva": int(data[0]),
-                    "xpa": int(data[1]),
-                    "lvb": int(data[2]),
-                    "xpb": int(data[3]),
-                    "rounds_played": int(data[4]),
-                    "targets_assassinated": int(data[5]),
-                    "escapes": int(data[6]),
-                    "guards_killed": int(data[7]),
-                    "targets_protected": int(data[8]),
-                    "damage_dealt": int(data[9]),
-                    "final_shots": int(data[10]),
-                    "target_survivals": int(data[11]),
-                    "ffa_kills": int(data[12]),
-                    "ffa_wins": int(data[13]),
-                    "infected_killed": int(data[14]),
-                    "infection_survival": int(data[15]),
-                    "infections": int(data[16]),
-                    "epidemics": int(data[17]),
-                }
-            )
+            stats_dict = self.parse_stats(stats)
+            metrics = self.calculate_metrics(stats_dict)
 
             # Determine embed title based on rounds played
-            rounds_played = int(data[4])
+            rounds_played = stats_dict["rounds_played"]
             title = (
                 "lifetime stats"
                 if rounds_played >= 9216
@@ -216,17 +228,10 @@ class CasualCalcCog(commands.Cog):
                 ClearButton(label="", style=discord.ButtonStyle.danger, emoji="🗑️")
             )
 
-            if interaction:
-                await interaction.response.send_message(embed=embed, view=view)
-            elif context:
-                await context.send(embed=embed, view=view)
+            await send_response(interaction, context, embed=embed, view=view)
 
         except Exception as e:
-            error_message = f"Error: {str(e)}"
-            if interaction:
-                await interaction.response.send_message(error_message)
-            elif context:
-                await context.send(error_message)
+            await send_response(interaction, context, f"Error: {str(e)}")
 
     @app_commands.command(
         name="casual", description="Calculate casual/lifetime OP from a copypasta"
@@ -0,0 +1,38 @@
+"""
+This module contains response helpers shared by the calculator cogs.
+"""
+
+import discord
+
+
+def trash_button():
+    """
+    Create a button that deletes the message it is attached to.
+
+    Returns:
+        discord.ui.Button: The delete button.
+    """
+    button = discord.ui.Button(label="", style=discord.ButtonStyle.danger, emoji="🗑️")
+
+    async def clear_message_callback(interaction):
+        await interaction.response.defer()
+        await interaction.message.delete()
+
+    button.callback = clear_message_callback
+    return button
+
+
+async def send_response(interaction=None, context=None, content=None, **kwargs):
+    """
+    Reply to a slash command interaction or a text command context.
+
+    Args:
+        interaction (discord.Interaction): The interaction object (optional).
+        context (discord.Context): The context object (optional).
+        content (str): The message text (optional).
+        **kwargs: Extra message options such as embed and view.
+    """
+    if interaction:
+        await interaction.response.send_message(content, **kwargs)
+    elif context:
+        await context.send(content, **kwargs)
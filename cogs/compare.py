@@ -0,0 +1,192 @@
+"""
+This module contains the CompareCog, which scores several stat lines side by side.
+"""
+
+import re
+import discord
+from discord import app_commands
+from discord.ext import commands
+from cogs.common import send_response, trash_button
+
+max_lines = 6
+
+# (label, metric key, formatter) rows for each stat line format; the formatter
+# matches how /calc (truncates) and /casual (rounds) display each value
+competitive_rows = [
+    ("OP", "OP", int),
+    ("TP", "TP", int),
+    ("SP", "SP", int),
+    ("GO", "GO", int),
+    ("AD", "AD", int),
+    ("XPR", "XPR", int),
+]
+casual_rows = [
+    ("OP", "op", round),
+    ("TP", "performance_score", round),
+    ("SP", "z_factor", round),
+    ("GO", "guard_objective", round),
+    ("AA", "assassin_aggression", round),
+    ("AD", "average_damage", round),
+    ("XPR", "experience_per_round", round),
+]
+
+
+class CompareCog(commands.Cog):
+    """
+    A cog for comparing several competitive or casual stat lines in one embed.
+    """
+
+    def __init__(self, bot):
+        """
+        Initialize the CompareCog with the bot instance.
+
+        Args:
+            bot (discord.Bot): The bot instance.
+        """
+        self.bot = bot
+
+    def split_lines(self, stats: str):
+        """
+        Split the input into stat lines separated by semicolons or newlines.
+
+        Args:
+            stats (str): The stat lines as a single string.
+
+        Returns:
+            list: The non-empty stat lines.
+        """
+        lines = [line.strip() for line in re.split(r"[;\n]", stats) if line.strip()]
+        if len(lines) < 2:
+            raise ValueError("Expected at least 2 stat lines separated by `;`!")
+        if len(lines) > max_lines:
+            raise ValueError(f"Too many stat lines, expected at most {max_lines}!")
+        return lines
+
+    def score_lines(self, lines):
+        """
+        Score every stat line in one pass through the existing calculate_metrics logic.
+
+        All lines must share a format: 16 values for competitive, 18 for casual.
+
+        Args:
+            lines (list): The stat lines to score.
+
+        Returns:
+            tuple: The list of metric dictionaries, the table rows and the division key.
+        """
+        lengths = {len(line.split()) for line in lines}
+        if lengths == {16}:
+            calc_cog = self.bot.get_cog("CalcCog")
+            if calc_cog is None:
+                raise RuntimeError("The competitive calculator is not loaded!")
+            parsed = [calc_cog.parse_stats(line) for line in lines]
+            results = [
+                calc_cog.calculate_metrics(stats, sdi=sdi, device=device)
+                for stats, sdi, device in parsed
+            ]
+            return results, competitive_rows, "Division"
+        if lengths == {18}:
+            casual_cog = self.bot.get_cog("CasualCalcCog")
+            if casual_cog is None:
+                raise RuntimeError("The casual calculator is not loaded!")
+            parsed = [casual_cog.parse_stats(line) for line in lines]
+            results = [casual_cog.calculate_metrics(stats) for stats in parsed]
+            return results, casual_rows, "division"
+        raise ValueError(
+            "All stat lines must use the same format, 16 values (competitive) or 18 values (casual)!"
+        )
+
+    def build_table(self, results, rows, division_key):
+        """
+        Format the scored lines as a compact table with deltas against the first line.
+
+        Args:
+            results (list): The metric dictionaries, one per stat line.
+            rows (list): The (label, metric key, formatter) rows to display.
+            division_key (str): The metric key holding the division.
+
+        Returns:
+            str: The table as a code block.
+        """
+        table = [[""] + [f"#{index}" for index in range(1, len(results) + 1)]]
+        for label, key, formatter in rows:
+            values = [formatter(metrics[key]) for metrics in results]
+            table.append(
+                [label, str(values[0])]
+                + [f"{value} ({value - values[0]:+d})" for value in values[1:]]
+            )
+
+        widths = [max(len(row[col]) for row in table) for col in range(len(table[0]))]
+        lines = [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in table
+        ]
+
+        lines.append("")
+        for index, metrics in enumerate(results, start=1):
+            penalty = " (auto-penalty)" if metrics.get("AutoPenalty") else ""
+            lines.append(f"#{index} {metrics[division_key]}{penalty}")
+
+        return "```glsl\n" + "\n".join(lines) + "\n```"
+
+    async def handle_compare(self, stats: str, interaction=None, context=None):
+        """
+        Shared logic for !compare (text command) and /compare (slash command).
+
+        Args:
+            stats (str): The stat lines separated by semicolons or newlines.
+            interaction (discord.Interaction): The interaction object (optional).
+            context (discord.Context): The context object (optional).
+        """
+        try:
+            results, rows, division_key = self.score_lines(self.split_lines(stats))
+
+            embed = discord.Embed(
+                title=f"comparing {len(results)} stat lines",
+                color=discord.Color.from_rgb(82, 146, 209),
+            )
+            embed.description = self.build_table(results, rows, division_key)
+
+            view = discord.ui.View()
+            view.add_item(trash_button())
+
+            await send_response(interaction, context, embed=embed, view=view)
+
+        except Exception as e:
+            await send_response(interaction, context, f"Error: {str(e)}")
+
+    @app_commands.command(
+        name="compare", description="Compare several stat lines side by side"
+    )
+    async def compare_slash(self, interaction: discord.Interaction, stats: str):
+        """
+        Slash command to compare stat lines.
+
+        Args:
+            interaction (discord.Interaction): The interaction object.
+            stats (str): format: 2 or more /calc or /casual stat lines separated by ;
+        """
+        await self.handle_compare(stats, interaction=interaction)
+
+    @commands.command(
+        name="compare", description="Compare several stat lines side by side"
+    )
+    async def compare_text(self, ctx, *, stats: str):
+        """
+        Text command to compare stat lines.
+
+        Args:
+            ctx (discord.Context): The context object.
+            stats (str): format: 2 or more .calc or .casual stat lines separated by ; or newlines
+        """
+        await self.handle_compare(stats, context=ctx)
+
+
+async def setup(bot):
+    """
+    Setup function to add the cog to the bot.
+
+    Args:
+        bot (discord.Bot): The bot instance.
+    """
+    await bot.add_cog(CompareCog(bot))
@@ -1,10 +1,12 @@
 """
 This module contains the PingCog, which includes a command to check the bot's latency.
-It also defines a listener to print a message when the cog is ready.
+It also defines a listener to print a message when the cog is ready,
+and a command to report the bot's cold-start timings.
 """
 
 import discord
 from discord.ext import commands
+import startup
 
 
 class PingCog(commands.Cog):
@@ -69,6 +71,46 @@ class PingCog(commands.Cog):
         embed.timestamp = discord.utils.utcnow()
         await ctx.send(embed=embed)
 
+    def startup_embed(self):
+        """
+        Build an embed with the measured cold-start timings.
+
+        Returns:
+            discord.Embed: The embed listing the startup profile.
+        """
+        embed = discord.Embed(
+            title="Startup",
+            description="```glsl\n" + "\n".join(startup.profile.summary()) + "\n```",
+            color=discord.Color.from_rgb(250, 254, 99),
+        )
+        if not startup.profile.enabled:
+            embed.set_footer(text="Set PROFILE_STARTUP=1 to include per-module import times.")
+        return embed
+
+    @discord.app_commands.command(
+        name="startup", description="Show the bot's cold-start timings"
+    )
+    async def startup_slash(self, interaction: discord.Interaction):
+        """
+        Respond with the bot's cold-start timings for slash commands.
+
+        Args:
+            interaction (discord.Interaction): The interaction object representing the command.
+        """
+        await interaction.response.send_message(
+            embed=self.startup_embed(), ephemeral=True
+        )
+
+    @commands.command(name="startup")
+    async def startup_text(self, ctx):
+        """
+        Respond with the bot's cold-start timings for prefix text commands.
+
+        Args:
+            ctx (commands.Context): The context in which the command was invoked.
+        """
+        await ctx.send(embed=self.startup_embed())
+
 
 async def setup(bot):
     """
@@ -8,26 +8,28 @@ custom command synchronization, and error handling logic.
 import logging
 import os
 import sys
-import discord
-from discord.ext import commands
-from dotenv import load_dotenv
+import time
+import startup  # Before discord: loads .env and profiles the imports that follow
+import discord  # pylint: disable=wrong-import-order
+from discord.ext import commands  # pylint: disable=wrong-import-order
 
-# Load bot token from .env file
-load_dotenv()
 logging.basicConfig(level=logging.INFO)
 
 # Set up bot with intents
 intents = discord.Intents.default()
 intents.message_content = True
 bot = commands.Bot(command_prefix=".", intents=intents)
+startup.profile.mark("imports")
 
 
 async def load_extensions():
     """Load bot extensions."""
-    extensions = ["cogs.calc", "cogs.ping", "cogs.casual"]
+    extensions = ["cogs.calc", "cogs.ping", "cogs.casual", "cogs.compare"]
     for extension in extensions:
         try:
+            start = time.perf_counter()
             await bot.load_extension(extension)
+            startup.profile.extensions[extension] = time.perf_counter() - start
         except ModuleNotFoundError as ex:
             logging.error("Extension not found: %s", ex)
         except ImportError as ex:
@@ -59,6 +61,11 @@ async def on_ready():
     )
     logging.info("Logged in as %s (ID: %s)", bot.user, bot.user.id)
 
+    if "ready" not in startup.profile.marks:
+        startup.profile.mark("ready")
+        startup.profile.remove_import_hook()
+        logging.info("Startup profile:\n%s", "\n".join(startup.profile.summary()))
+
 
 @bot.event
 async def on_command_error(ctx, error):
@@ -0,0 +1,212 @@
+"""
+Startup helpers for measuring Nerd bot cold-start time.
+
+Importing this module loads the .env file, dates the cold-start clock from
+the OS process creation time and, when PROFILE_STARTUP is set, times every
+module imported afterwards. main.py imports it before discord so those
+imports are measured too. The same code runs from source and from the
+PyInstaller bundle, where the clock also covers the bootloader.
+"""
+
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from dotenv import load_dotenv
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+
+def process_age():
+    """
+    Measure how long ago the OS created this process.
+
+    Returns:
+        float: The process age in seconds, or None if the platform does not expose it.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/stat", encoding="ascii") as stat_file:
+                stat = stat_file.read()
+            with open("/proc/uptime", encoding="ascii") as uptime_file:
+                uptime = float(uptime_file.read().split()[0])
+            # Fields after the parenthesised command name start at field 3; starttime is field 22
+            start_ticks = int(stat[stat.rindex(")") + 2 :].split()[19])
+            return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            creation, exited, kernel, user, now = (wintypes.FILETIME() for _ in range(5))
+            if not kernel32.GetProcessTimes(
+                kernel32.GetCurrentProcess(),
+                ctypes.byref(creation),
+                ctypes.byref(exited),
+                ctypes.byref(kernel),
+                ctypes.byref(user),
+            ):
+                return None
+            kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+
+            def ticks(filetime):
+                return (filetime.dwHighDateTime << 32) | filetime.dwLowDateTime
+
+            # FILETIME counts 100 ns intervals
+            return max(0.0, (ticks(now) - ticks(creation)) / 1e7)
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+_age = process_age()
+if _age is None:
+    process_start, start_label = time.perf_counter(), "startup.py import"
+else:
+    process_start, start_label = time.perf_counter() - _age, "process start"
+
+# Load bot token and settings from .env file
+load_dotenv()
+
+
+class _TimedLoader:
+    """
+    Wraps a module loader so creating and executing the module is timed.
+    Every other attribute is delegated to the wrapped loader.
+    """
+
+    def __init__(self, loader, startup_profile):
+        self._loader = loader
+        self._profile = startup_profile
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._profile.timed(spec.name, self._loader.create_module, spec)
+
+    def exec_module(self, module):
+        self._profile.timed(module.__spec__.name, self._loader.exec_module, module)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """
+    A meta path finder that asks the other finders for each module's spec and
+    wraps its loader, so every module load is timed however it was imported.
+    """
+
+    def __init__(self, startup_profile):
+        self._profile = startup_profile
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                if hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._profile)
+                return spec
+        return None
+
+
+class StartupProfile:
+    """
+    Collects cold-start timings: startup milestones, extension loads and,
+    in profiling mode, per-module import times.
+    """
+
+    def __init__(self, start, label):
+        """
+        Initialize the profile.
+
+        Args:
+            start (float): The perf_counter value the clock starts from.
+            label (str): What the clock starts from, used in the summary.
+        """
+        self.start = start
+        self.start_label = label
+        self.enabled = os.getenv("PROFILE_STARTUP", "").lower() in ("1", "true", "yes")
+        self.frozen = getattr(sys, "frozen", False)
+        self.marks = {}
+        self.imports = {}
+        self.extensions = {}
+        self._finder = None
+        self._local = threading.local()
+
+    def mark(self, name):
+        """
+        Record the first time a startup milestone is reached.
+
+        Args:
+            name (str): The milestone name (e.g. "imports", "ready").
+        """
+        self.marks.setdefault(name, time.perf_counter() - self.start)
+
+    def timed(self, name, func, *args):
+        """
+        Run one step of loading a module and add its own time to the module.
+
+        Time spent loading other modules inside the step is subtracted, so the
+        slowest entries are real hotspots rather than one nested import chain.
+
+        Args:
+            name (str): The module name.
+            func (callable): The loader step to run.
+            *args: The arguments for the loader step.
+
+        Returns:
+            object: What the loader step returned.
+        """
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.imports[name] = self.imports.get(name, 0.0) + elapsed - nested
+
+    def install_import_hook(self):
+        """Time every module loaded from now on, if profiling is enabled."""
+        if not self.enabled or self._finder is not None:
+            return
+        self._finder = _TimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def remove_import_hook(self):
+        """Stop timing newly loaded modules."""
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def summary(self, limit=10):
+        """
+        Format the collected timings.
+
+        Args:
+            limit (int): How many of the slowest imports to include.
+
+        Returns:
+            list: The summary lines.
+        """
+        lines = [f"build: {'frozen' if self.frozen else 'source'}"]
+        for name, elapsed in self.marks.items():
+            lines.append(f"{name}: {elapsed * 1000:.0f} ms after {self.start_label}")
+        for name, elapsed in self.extensions.items():
+            lines.append(f"load {name}: {elapsed * 1000:.1f} ms")
+        if self.imports:
+            slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)
+            for name, elapsed in slowest[:limit]:
+                lines.append(f"import {name}: {elapsed * 1000:.1f} ms (own time)")
+        return lines
+
+
+profile = StartupProfile(process_start, start_label)
+profile.install_import_hook()